@@ -1,9 +1,17 @@
 import tkinter as tk
-from PIL import Image, ImageTk, ImageGrab
+from PIL import Image, ImageTk, ImageColor
 import pandas as pd
 import numpy as np
 import cv2
 import io
+import math
+import os
+import shutil
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+_DEG2RAD = math.pi / 180.0
 
 class JointCalculator:
     """
@@ -25,6 +33,17 @@ class JointCalculator:
         }
         self.angle_params = angle_params or self.default_params
 
+        # The signal-to-angle interpolation is fixed per joint, so fold it into
+        # angle = signal * scale + offset once, as arrays in self._joints order.
+        self._joints = list(self.angle_params)
+        params = [self.angle_params[joint] for joint in self._joints]
+        signal_min = np.array([p['signal_min'] for p in params], dtype=float)
+        signal_max = np.array([p['signal_max'] for p in params], dtype=float)
+        angle_min = np.array([p['angle_min'] for p in params], dtype=float)
+        angle_max = np.array([p['angle_max'] for p in params], dtype=float)
+        self._scale = (angle_max - angle_min) / (signal_max - signal_min)
+        self._offset = angle_min - signal_min * self._scale
+
     @staticmethod
     def linear_interpolation(x, x0, y0, x1, y1):
         """
@@ -50,14 +69,15 @@ class JointCalculator:
         Returns:
             pandas.DataFrame: The dataframe with added angle columns.
         """
-        for joint, params in self.angle_params.items():
-            df[f'{joint} (Angle)'] = df[f'{joint}'].apply(
-                lambda x: self.linear_interpolation(
-                    x,
-                    params['signal_min'], params['angle_min'],
-                    params['signal_max'], params['angle_max']
-                )
-            )
+        joints = self._joints
+        # Apply the per-joint affine map to all joints at once on an (N, 3) array,
+        # staying in float32 when the signals were read as float32.
+        signals = df[joints].to_numpy()
+        dtype = np.result_type(signals.dtype, np.float32)
+        angles = signals.astype(dtype, copy=False) * self._scale.astype(dtype) + self._offset.astype(dtype)
+
+        for i, joint in enumerate(joints):
+            df[f'{joint} (Angle)'] = angles[:, i]
         return df
 
     @staticmethod
@@ -73,14 +93,67 @@ class JointCalculator:
         Returns:
             tuple: Positions of knee, ankle, toe, and angles of hip, knee, foot.
         """
+        # Scalar inputs: math.cos/math.sin avoid the per-call NumPy dispatch overhead.
+        hx, hy = float(hip_joint[0]), float(hip_joint[1])
         hip_angle = -theta_h - 90
-        knee_pos = hip_joint + L1 * np.array([np.cos(np.radians(hip_angle)), -np.sin(np.radians(hip_angle))])
+        r = hip_angle * _DEG2RAD
+        knee_x = hx + L1 * math.cos(r)
+        knee_y = hy - L1 * math.sin(r)
         knee_angle = 90 - theta_h - theta_k
-        ankle_pos = knee_pos + L2 * np.array([np.cos(np.radians(knee_angle)), -np.sin(np.radians(knee_angle))])
+        r = knee_angle * _DEG2RAD
+        ankle_x = knee_x + L2 * math.cos(r)
+        ankle_y = knee_y - L2 * math.sin(r)
         foot_angle = 270 - theta_h - theta_k + theta_f
-        toe_pos = ankle_pos + L3 * np.array([np.cos(np.radians(foot_angle)), -np.sin(np.radians(foot_angle))])
+        r = foot_angle * _DEG2RAD
+        toe_x = ankle_x + L3 * math.cos(r)
+        toe_y = ankle_y - L3 * math.sin(r)
+        # Positions stay ndarrays at the boundary so callers can keep doing vector arithmetic on them.
+        knee_pos = np.array([knee_x, knee_y])
+        ankle_pos = np.array([ankle_x, ankle_y])
+        toe_pos = np.array([toe_x, toe_y])
         return knee_pos, ankle_pos, toe_pos, hip_angle, knee_angle, foot_angle
 
+    @staticmethod
+    def calculate_chain_positions(base, lengths, angles):
+        """
+        Calculate joint positions of a segment chain for every frame as a product of homogeneous transforms.
+
+        Each segment is a 3x3 transform rotating by its angle relative to the previous segment and
+        translating by its length. The transforms are chained with batched ``np.matmul`` over all
+        frames, and each joint position is the translation column of the accumulated transform.
+
+        Args:
+            base (numpy.array): The (x, y) position of the first joint.
+            lengths (list): Lengths of the S segments.
+            angles (numpy.ndarray): (S, N) absolute segment angles in degrees for N frames.
+
+        Returns:
+            numpy.ndarray: The (N, S + 1, 2) joint positions, starting with ``base``.
+        """
+        angles = np.asarray(angles, dtype=float)
+        relative = np.deg2rad(np.diff(angles, axis=0, prepend=0))
+        cos, sin = np.cos(relative), np.sin(relative)
+        lengths = np.asarray(lengths, dtype=float)[:, None]
+
+        # Rotate(angle) @ Translate(length, 0) in screen coordinates (y axis pointing down).
+        links = np.zeros(angles.shape + (3, 3))
+        links[..., 0, 0] = cos
+        links[..., 0, 1] = sin
+        links[..., 0, 2] = lengths * cos
+        links[..., 1, 0] = -sin
+        links[..., 1, 1] = cos
+        links[..., 1, 2] = -lengths * sin
+        links[..., 2, 2] = 1
+
+        transform = np.broadcast_to(np.eye(3), (angles.shape[1], 3, 3)).copy()
+        transform[:, :2, 2] = base
+        positions = np.empty((angles.shape[1], angles.shape[0] + 1, 2))
+        positions[:, 0] = base
+        for i, link in enumerate(links):
+            transform = transform @ link
+            positions[:, i + 1] = transform[:, :2, 2]
+        return positions
+
 class ImageHandler:
     """
     A class for handling image operations such as resizing.
@@ -117,8 +190,32 @@ class ImageHandler:
         else:
             new_height = length / ratio
             new_width = new_height * aspect_ratio
-        
-        return image.resize((int(new_width), int(new_height)), Image.LANCZOS)
+
+        size = (int(new_width), int(new_height))
+        if image.size == size:
+            return image
+        return image.resize(size, Image.LANCZOS)
+
+    @staticmethod
+    def grid_image(width, height, interval, bg_color, line_color):
+        """
+        Create a background image with a grid drawn by NumPy slicing.
+
+        Args:
+            width (int): Width of the image.
+            height (int): Height of the image.
+            interval (int): Spacing between grid lines.
+            bg_color (tuple): Background color, in the channel order of the result.
+            line_color (tuple): Grid line color, in the channel order of the result.
+
+        Returns:
+            numpy.ndarray: The (height, width, 3) uint8 image.
+        """
+        image = np.empty((height, width, 3), dtype=np.uint8)
+        image[:] = bg_color
+        image[::interval, :] = line_color
+        image[:, ::interval] = line_color
+        return image
 
 class AnimationCanvas:
     """
@@ -141,14 +238,18 @@ class AnimationCanvas:
         """
         self.canvas = tk.Canvas(root, width=width, height=height, bg=bg_color)
         self.canvas.pack()
+        self.bg_color = bg_color
         self.joint_color = joint_color
         self.bone_color = bone_color
         self.bone_width = bone_width
         self.show_grid = show_grid
+        self._rot_cache = {}
 
     def draw_grid(self, width, height, interval):
         """
-        Draw a grid on the canvas.
+        Draw a grid on the canvas as a single static image tagged "grid".
+
+        Per-frame items are tagged "dyn", so the grid only needs to be drawn once.
 
         Args:
             width (int): Width of the grid.
@@ -156,10 +257,11 @@ class AnimationCanvas:
             interval (int): Spacing between grid lines.
         """
         if self.show_grid:
-            for i in range(0, width, interval):
-                self.canvas.create_line(i, 0, i, height, fill='lightgray')
-            for i in range(0, height, interval):
-                self.canvas.create_line(0, i, width, i, fill='lightgray')
+            grid_image = ImageHandler.grid_image(width, height, interval, ImageColor.getrgb(self.bg_color)[:3],
+                                                 ImageColor.getrgb('lightgray'))
+            self._grid_img = ImageTk.PhotoImage(Image.fromarray(grid_image))
+            self.canvas.delete("grid")
+            self.canvas.create_image(0, 0, anchor='nw', image=self._grid_img, tags="grid")
 
     def display_image(self, image, position, angle):
         """
@@ -168,15 +270,21 @@ class AnimationCanvas:
         Args:
             image (PIL.Image): The image to display.
             position (tuple): The (x, y) position to place the image.
-            angle (float): The rotation angle in degrees.
+            angle (float): The rotation angle in degrees, rounded to whole degrees.
 
         Returns:
             ImageTk.PhotoImage: The displayed image object.
         """
-        rotated_image = image.rotate(angle, expand=True)
-        tk_image = ImageTk.PhotoImage(rotated_image)
+        # Rotated images are cached per image and whole-degree angle, so each
+        # rotation is only resampled the first time it is needed.
+        key = (id(image), int(round(angle)))
+        tk_image = self._rot_cache.get(key)
+        if tk_image is None:
+            rotated_image = image.rotate(key[1], resample=Image.BILINEAR, expand=True)
+            tk_image = ImageTk.PhotoImage(rotated_image)
+            self._rot_cache[key] = tk_image
         x, y = position
-        self.canvas.create_image(x, y, image=tk_image)
+        self.canvas.create_image(x, y, image=tk_image, tags="dyn")
         return tk_image
 
     def draw_joints_and_bones(self, hip_joint, knee_pos, ankle_pos, toe_pos):
@@ -188,11 +296,339 @@ class AnimationCanvas:
         """
         joints = [hip_joint, knee_pos, ankle_pos, toe_pos]
         for joint in joints:
-            self.canvas.create_oval(joint[0]-5, joint[1]-5, joint[0]+5, joint[1]+5, fill=self.joint_color)
+            self.canvas.create_oval(joint[0]-5, joint[1]-5, joint[0]+5, joint[1]+5, fill=self.joint_color, tags="dyn")
+
+        self.canvas.create_line(hip_joint[0], hip_joint[1], knee_pos[0], knee_pos[1],
+                                ankle_pos[0], ankle_pos[1], toe_pos[0], toe_pos[1],
+                                fill=self.bone_color, width=self.bone_width, tags="dyn")
+
+class OffscreenRenderer:
+    """
+    A class for rendering animation frames directly into a NumPy BGR buffer for video output.
+    """
+
+    def __init__(self, width, height, bg_color='white', joint_color='black', bone_color='blue', bone_width=2, show_grid=True,
+                 grid_interval=50):
+        """
+        Initialize the OffscreenRenderer.
+
+        Args:
+            width (int): Width of the frame.
+            height (int): Height of the frame.
+            bg_color (str): Background color of the frame.
+            joint_color (str): Color of the joint markers.
+            bone_color (str): Color of the bones (lines connecting joints).
+            bone_width (int): Thickness of the bone lines.
+            show_grid (bool): Whether to display a grid in the background.
+            grid_interval (int): Spacing between grid lines.
+        """
+        self.width = width
+        self.height = height
+        self.bg_color = self.to_bgr(bg_color)
+        self.joint_color = self.to_bgr(joint_color)
+        self.bone_color = self.to_bgr(bone_color)
+        self.grid_color = self.to_bgr('lightgray')
+        self.bone_width = bone_width
+        self.show_grid = show_grid
+        self.grid_interval = grid_interval
+        self._allocate_buffers()
+
+    def _allocate_buffers(self):
+        """
+        Allocate the static background, the frame buffer and the alpha blending scratch buffers.
+        """
+        if self.show_grid:
+            self._background = ImageHandler.grid_image(self.width, self.height, self.grid_interval,
+                                                       self.bg_color, self.grid_color)
+        else:
+            self._background = np.empty((self.height, self.width, 3), dtype=np.uint8)
+            self._background[:] = self.bg_color
+        self.frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._alpha = np.empty((self.height, self.width, 1), dtype=np.float32)
+        self._blend = np.empty((self.height, self.width, 3), dtype=np.float32)
+
+    def __getstate__(self):
+        # Buffers are reallocated when unpickled (e.g. in a worker process) rather than copied.
+        state = self.__dict__.copy()
+        for name in ('frame', '_background', '_alpha', '_blend'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._allocate_buffers()
+
+    @staticmethod
+    def to_bgr(color):
+        """
+        Convert a Tk/PIL color name or hex code to an OpenCV BGR tuple.
+
+        Args:
+            color (str): Color name (e.g. 'lightblue') or hexadecimal color code.
+
+        Returns:
+            tuple: The (B, G, R) color.
+        """
+        r, g, b = ImageColor.getrgb(color)[:3]
+        return (b, g, r)
+
+    @staticmethod
+    def prepare_image(image):
+        """
+        Convert a PIL image to a BGRA array suitable for drawing.
+
+        Args:
+            image (PIL.Image): The image to convert.
+
+        Returns:
+            numpy.ndarray: The (H, W, 4) uint8 BGRA image.
+        """
+        return cv2.cvtColor(np.asarray(image.convert('RGBA')), cv2.COLOR_RGBA2BGRA)
+
+    def clear(self):
+        """
+        Reset the frame to the background, including the grid if enabled, with a single copy.
+        """
+        np.copyto(self.frame, self._background)
+
+    @staticmethod
+    def rotate_image(image, angle):
+        """
+        Rotate a BGRA image, expanding it to hold the whole result and cropping it to its visible pixels.
+
+        Args:
+            image (numpy.ndarray): The BGRA image from ``prepare_image``.
+            angle (float): The counter-clockwise rotation angle in degrees.
+
+        Returns:
+            tuple: The rotated BGRA tile and the (x, y) offset of its top-left corner from the image center.
+        """
+        h, w = image.shape[:2]
+        matrix = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+        cos, sin = abs(matrix[0, 0]), abs(matrix[0, 1])
+        new_w = int(np.ceil(h * sin + w * cos))
+        new_h = int(np.ceil(h * cos + w * sin))
+        matrix[0, 2] += new_w / 2 - w / 2
+        matrix[1, 2] += new_h / 2 - h / 2
+        rotated = cv2.warpAffine(image, matrix, (new_w, new_h), flags=cv2.INTER_LINEAR,
+                                 borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0, 0))
+
+        x, y, crop_w, crop_h = cv2.boundingRect(rotated[:, :, 3])
+        tile = np.ascontiguousarray(rotated[y:y + crop_h, x:x + crop_w])
+        return tile, (x - new_w // 2, y - new_h // 2)
+
+    @classmethod
+    def build_atlas(cls, image, angles):
+        """
+        Pre-rotate an image at every whole-degree angle it is displayed at.
+
+        Args:
+            image (numpy.ndarray): The BGRA image from ``prepare_image``.
+            angles (numpy.ndarray): The rotation angles in degrees for every frame.
+
+        Returns:
+            dict: Maps each rounded angle to the tile and offset returned by ``rotate_image``.
+        """
+        return {angle: cls.rotate_image(image, angle) for angle in np.unique(np.rint(angles)).astype(int).tolist()}
+
+    def paste_tile(self, tile, offset, position):
+        """
+        Alpha-blend a BGRA tile onto the frame.
+
+        Args:
+            tile (numpy.ndarray): The BGRA tile.
+            offset (tuple): The (x, y) offset of the tile's top-left corner from ``position``.
+            position (tuple): The (x, y) position of the image center.
+        """
+        tile_h, tile_w = tile.shape[:2]
+        x0 = int(round(position[0])) + offset[0]
+        y0 = int(round(position[1])) + offset[1]
+        fx0, fy0 = max(x0, 0), max(y0, 0)
+        fx1, fy1 = min(x0 + tile_w, self.width), min(y0 + tile_h, self.height)
+        if fx0 >= fx1 or fy0 >= fy1:
+            return
+
+        sprite = tile[fy0 - y0:fy1 - y0, fx0 - x0:fx1 - x0]
+        roi = self.frame[fy0:fy1, fx0:fx1]
+        alpha = self._alpha[:fy1 - fy0, :fx1 - fx0]
+        blend = self._blend[:fy1 - fy0, :fx1 - fx0]
+
+        # roi + (sprite - roi) * alpha, computed in place in the scratch buffers.
+        np.multiply(sprite[:, :, 3:4], np.float32(1 / 255), out=alpha)
+        np.subtract(sprite[:, :, :3], roi, out=blend, dtype=np.float32)
+        blend *= alpha
+        blend += roi
+        np.copyto(roi, blend, casting='unsafe')
+
+    def draw_joints_and_bones(self, hip_joint, knee_pos, ankle_pos, toe_pos):
+        """
+        Draw joints as circles and bones as lines on the frame.
+
+        Args:
+            hip_joint, knee_pos, ankle_pos, toe_pos (numpy.array): Joint positions.
+        """
+        points = np.rint(np.stack([hip_joint, knee_pos, ankle_pos, toe_pos])).astype(np.int32)
+        for x, y in points:
+            cv2.circle(self.frame, (int(x), int(y)), 5, self.joint_color, -1, cv2.LINE_AA)
+
+        cv2.polylines(self.frame, [points], False, self.bone_color, self.bone_width, cv2.LINE_AA)
+
+    def render(self, atlases, centers, angles, joints=None):
+        """
+        Render a complete frame: background with grid, body-part images and optionally joints and bones.
+
+        Args:
+            atlases (list): Pre-rotated hip, knee and foot images from ``build_atlas``.
+            centers (numpy.ndarray): (3, 2) center positions of the images.
+            angles (numpy.ndarray): (3,) rotation angles of the images in degrees, rounded to whole degrees.
+            joints (numpy.ndarray, optional): (4, 2) hip, knee, ankle and toe positions.
+                If None, joints and bones are not drawn.
+
+        Returns:
+            numpy.ndarray: The rendered frame. It is overwritten by the next call.
+        """
+        self.clear()
+
+        for atlas, center, angle in zip(atlases, centers, angles):
+            tile, offset = atlas[int(round(angle))]
+            self.paste_tile(tile, offset, center)
+
+        if joints is not None:
+            self.draw_joints_and_bones(*joints)
+        return self.frame
+
+class FFmpegWriter:
+    """
+    A class for encoding BGR frames by piping them as raw video to an ffmpeg process.
+
+    It mirrors the ``write``/``release`` interface of ``cv2.VideoWriter``.
+    """
+
+    # H.264 encoders in order of preference: hardware encoders first, then software libx264.
+    ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox', 'libx264')
+
+    def __init__(self, path, frame_rate, frame_size, ffmpeg='ffmpeg', encoder='libx264'):
+        """
+        Start the ffmpeg process.
+
+        Args:
+            path (str): Path of the output video file.
+            frame_rate (float): Frames per second of the output video.
+            frame_size (tuple): The (width, height) of the frames.
+            ffmpeg (str): The ffmpeg executable.
+            encoder (str): The ffmpeg H.264 encoder, e.g. from ``select_encoder``.
+        """
+        width, height = frame_size
+        self.process = subprocess.Popen(
+            [ffmpeg, '-y', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{width}x{height}', '-r', str(frame_rate), '-i', '-',
+             *self._encoder_args(encoder), path],
+            stdin=subprocess.PIPE)
+
+    @staticmethod
+    def _encoder_args(encoder):
+        """
+        Build the ffmpeg output options for an encoder.
+
+        Args:
+            encoder (str): The ffmpeg H.264 encoder.
+
+        Returns:
+            list: The ffmpeg command-line options.
+        """
+        args = ['-c:v', encoder]
+        if encoder == 'libx264':
+            args += ['-preset', 'ultrafast']
+        return args + ['-pix_fmt', 'yuv420p']
 
-        self.canvas.create_line(hip_joint[0], hip_joint[1], knee_pos[0], knee_pos[1], fill=self.bone_color, width=self.bone_width)
-        self.canvas.create_line(knee_pos[0], knee_pos[1], ankle_pos[0], ankle_pos[1], fill=self.bone_color, width=self.bone_width)
-        self.canvas.create_line(ankle_pos[0], ankle_pos[1], toe_pos[0], toe_pos[1], fill=self.bone_color, width=self.bone_width)
+    @classmethod
+    def select_encoder(cls, ffmpeg, path, frame_size, frame_rate):
+        """
+        Pick the first H.264 encoder in ``ENCODERS`` that ffmpeg lists and can actually use.
+
+        Being listed is not enough: hardware encoders are often compiled in without the matching
+        GPU or driver, some builds (e.g. Fedora's ``ffmpeg-free``) lack ``libx264``, and the output
+        file may not be writable. Each candidate encodes one generated frame to ``path``, which
+        ``FFmpegWriter`` later overwrites.
+
+        Args:
+            ffmpeg (str): The ffmpeg executable.
+            path (str): Path of the output video file.
+            frame_size (tuple): The (width, height) of the frames.
+            frame_rate (float): Frames per second of the output video.
+
+        Returns:
+            str or None: The encoder name, or None if ffmpeg cannot be used.
+        """
+        width, height = frame_size
+        try:
+            result = subprocess.run([ffmpeg, '-hide_banner', '-encoders'],
+                                    capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+        listed = {line.split()[1] for line in result.stdout.splitlines() if len(line.split()) > 1}
+
+        for encoder in cls.ENCODERS:
+            if encoder not in listed:
+                continue
+            try:
+                result = subprocess.run(
+                    [ffmpeg, '-hide_banner', '-loglevel', 'error', '-y',
+                     '-f', 'lavfi', '-i', f'color=c=black:s={width}x{height}:r={frame_rate}', '-frames:v', '1',
+                     *cls._encoder_args(encoder), path],
+                    capture_output=True, timeout=30)
+            except (OSError, subprocess.SubprocessError):
+                continue
+            if result.returncode == 0:
+                return encoder
+        return None
+
+    def write(self, frame):
+        """
+        Write a single frame.
+
+        Args:
+            frame (numpy.ndarray): The (height, width, 3) uint8 BGR frame.
+        """
+        self.process.stdin.write(np.ascontiguousarray(frame).data)
+
+    def release(self):
+        """
+        Finish encoding and wait for ffmpeg to exit.
+        """
+        if not self.process.stdin.closed:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:
+                # ffmpeg already exited; nothing is left to flush.
+                pass
+        self.process.wait()
+
+_render_worker_state = {}
+
+def _init_render_worker(renderer, atlases, center_arr, angle_arr, joint_pos_arr):
+    """
+    Store the renderer and precomputed frame data in a worker process, once per worker.
+    """
+    _render_worker_state.update(renderer=renderer, atlases=atlases, center_arr=center_arr,
+                                angle_arr=angle_arr, joint_pos_arr=joint_pos_arr)
+
+def _render_chunk(start, stop, is_show_born_joint):
+    """
+    Render frames ``start`` to ``stop`` in a worker process.
+
+    Returns:
+        numpy.ndarray: The (stop - start, height, width, 3) BGR frames.
+    """
+    state = _render_worker_state
+    renderer = state['renderer']
+    frames = np.empty((stop - start, renderer.height, renderer.width, 3), dtype=np.uint8)
+    for i, frame in enumerate(range(start, stop)):
+        joints = state['joint_pos_arr'][frame] if is_show_born_joint else None
+        frames[i] = renderer.render(state['atlases'], state['center_arr'][frame], state['angle_arr'][frame], joints)
+    return frames
 
 class WalkingAnimation:
     """
@@ -218,19 +654,27 @@ class WalkingAnimation:
         """
         self.joint_calculator = JointCalculator(angle_params)
         
-        self.df = pd.read_csv(f"inputs/{csv_file}")
+        joints = list(self.joint_calculator.angle_params)
+        self.df = pd.read_csv(f"inputs/{csv_file}", usecols=joints, dtype=dict.fromkeys(joints, np.float32))
         self.df = self.joint_calculator.convert_to_angle(self.df)
         
         self.bone_lengths = bone_lengths or {'L1': 250, 'L2': 300, 'L3': 90}
         self.hip_joint = np.array(hip_position or [350, 100])
+        self._precompute_kinematics()
 
-        self.root = tk.Tk()
-        self.canvas = AnimationCanvas(self.root, 1000, 1000, bg_color, joint_color, bone_color, bone_width, show_grid)
+        self.root = None
+        self.canvas = None
+        self.canvas_options = (bg_color, joint_color, bone_color, bone_width, show_grid)
+        self.renderer = OffscreenRenderer(1000, 1000, bg_color, joint_color, bone_color, bone_width, show_grid)
         
         self.hip_image = ImageHandler.resize_image('assets/hip_image.png', self.bone_lengths['L1'])
         self.knee_image = ImageHandler.resize_image('assets/knee_image.png', self.bone_lengths['L2'])
         self.foot_image = ImageHandler.resize_image('assets/foot_image.png', self.bone_lengths['L3'])
 
+        # Every rotation needed by the video is rendered once here, so frames only paste tiles.
+        self.atlases = [OffscreenRenderer.build_atlas(OffscreenRenderer.prepare_image(image), angles)
+                        for image, angles in zip((self.hip_image, self.knee_image, self.foot_image), self.angle_arr.T)]
+
         self.global_hip_image = None
         self.global_knee_image = None
         self.global_foot_image = None
@@ -238,8 +682,90 @@ class WalkingAnimation:
         self.frame_rate = 10
         self.total_frames = len(self.df)
 
+        self.out = self._open_video_writer(f"output/{output_file}")
+
+    def _open_video_writer(self, path):
+        """
+        Open the video writer.
+
+        If an ``ffmpeg`` executable on the PATH can encode a test frame to ``path`` with one of
+        ``FFmpegWriter.ENCODERS``, frames are piped straight to it with ``FFmpegWriter``, using
+        NVENC, QuickSync or VideoToolbox when available and ``libx264`` otherwise. If not, the
+        OpenCV writer from ``_open_cv2_writer`` is used.
+
+        Args:
+            path (str): Path of the output video file.
+
+        Returns:
+            FFmpegWriter or cv2.VideoWriter: The opened video writer.
+        """
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is not None:
+            encoder = FFmpegWriter.select_encoder(ffmpeg, path, (1000, 1000), self.frame_rate)
+            if encoder is not None:
+                return FFmpegWriter(path, self.frame_rate, (1000, 1000), ffmpeg, encoder)
+        return self._open_cv2_writer(path)
+
+    def _open_cv2_writer(self, path):
+        """
+        Open an OpenCV video writer with software MPEG-4 (``mp4v``).
+
+        The pinned ``opencv-python`` wheel ships no usable H.264 encoder, so hardware-accelerated
+        H.264 goes through ``FFmpegWriter`` instead.
+
+        Args:
+            path (str): Path of the output video file.
+
+        Returns:
+            cv2.VideoWriter: The opened video writer.
+        """
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        self.out = cv2.VideoWriter(f"output/{output_file}", fourcc, 10.0, (1000, 1000))
+        return cv2.VideoWriter(path, fourcc, float(self.frame_rate), (1000, 1000))
+
+    def _precompute_kinematics(self):
+        """
+        Calculate joint positions and segment angles for every frame in one vectorized pass.
+
+        Sets ``joint_pos_arr`` (N, 4, 2) and ``center_arr`` (N, 3, 2), with (N, 2) views
+        ``knee_pos_arr``, ``ankle_pos_arr``, ``toe_pos_arr`` and the segment ``*_center_arr``,
+        and ``angle_arr`` (N, 3) with (N,) views ``hip_angle_arr``, ``knee_angle_arr``, ``foot_angle_arr``.
+        """
+        theta_h = self.df['Hip (Angle)'].to_numpy(dtype=float)
+        theta_k = self.df['Knee (Angle)'].to_numpy(dtype=float)
+        theta_f = self.df['Foot (Angle)'].to_numpy(dtype=float)
+
+        self.angle_arr = np.stack([-theta_h - 90, 90 - theta_h - theta_k, 270 - theta_h - theta_k + theta_f], axis=1)
+        self.hip_angle_arr = self.angle_arr[:, 0]
+        self.knee_angle_arr = self.angle_arr[:, 1]
+        self.foot_angle_arr = self.angle_arr[:, 2]
+
+        # (N, 4, 2) hip/knee/ankle/toe positions and (N, 3, 2) segment midpoints.
+        self.joint_pos_arr = self.joint_calculator.calculate_chain_positions(
+            self.hip_joint,
+            [self.bone_lengths['L1'], self.bone_lengths['L2'], self.bone_lengths['L3']],
+            self.angle_arr.T)
+        self.center_arr = 0.5 * (self.joint_pos_arr[:, :-1] + self.joint_pos_arr[:, 1:])
+
+        self.knee_pos_arr = self.joint_pos_arr[:, 1]
+        self.ankle_pos_arr = self.joint_pos_arr[:, 2]
+        self.toe_pos_arr = self.joint_pos_arr[:, 3]
+        self.hip_center_arr = self.center_arr[:, 0]
+        self.knee_center_arr = self.center_arr[:, 1]
+        self.foot_center_arr = self.center_arr[:, 2]
+
+    def render_frame(self, frame, is_show_born_joint=False):
+        """
+        Render a single frame offscreen for the video output.
+
+        Args:
+            frame (int): The frame number to render.
+            is_show_born_joint (bool): Whether to show joints and bones.
+
+        Returns:
+            numpy.ndarray: The rendered (1000, 1000, 3) BGR frame.
+        """
+        joints = self.joint_pos_arr[frame] if is_show_born_joint else None
+        return self.renderer.render(self.atlases, self.center_arr[frame], self.angle_arr[frame], joints)
 
     def animate(self, frame, is_show_born_joint=False):
         """
@@ -254,20 +780,18 @@ class WalkingAnimation:
             self.root.destroy()
             return
 
-        self.canvas.canvas.delete("all")
-        self.canvas.draw_grid(1000, 1000, 50)
-
-        theta_h = self.df['Hip (Angle)'].iloc[frame]
-        theta_k = self.df['Knee (Angle)'].iloc[frame]
-        theta_f = self.df['Foot (Angle)'].iloc[frame]
+        self.canvas.canvas.delete("dyn")
 
-        knee_pos, ankle_pos, toe_pos, hip_angle, knee_angle, foot_angle = self.joint_calculator.calculate_joint_positions(
-            self.hip_joint, self.bone_lengths['L1'], self.bone_lengths['L2'], self.bone_lengths['L3'],
-            theta_h, theta_k, theta_f)
+        knee_pos = self.knee_pos_arr[frame]
+        ankle_pos = self.ankle_pos_arr[frame]
+        toe_pos = self.toe_pos_arr[frame]
+        hip_angle = self.hip_angle_arr[frame]
+        knee_angle = self.knee_angle_arr[frame]
+        foot_angle = self.foot_angle_arr[frame]
 
-        hip_center = (self.hip_joint + knee_pos) / 2
-        knee_center = (knee_pos + ankle_pos) / 2
-        foot_center = (ankle_pos + toe_pos) / 2
+        hip_center = self.hip_center_arr[frame]
+        knee_center = self.knee_center_arr[frame]
+        foot_center = self.foot_center_arr[frame]
 
         self.global_hip_image = self.canvas.display_image(self.hip_image, hip_center, hip_angle)
         self.global_knee_image = self.canvas.display_image(self.knee_image, knee_center, knee_angle)
@@ -277,33 +801,95 @@ class WalkingAnimation:
             self.canvas.draw_joints_and_bones(self.hip_joint, knee_pos, ankle_pos, toe_pos)
 
         self.canvas.canvas.update()
-        x = self.canvas.canvas.winfo_rootx()
-        y = self.canvas.canvas.winfo_rooty()
-        x1 = x + self.canvas.canvas.winfo_width()
-        y1 = y + self.canvas.canvas.winfo_height()
-        img = ImageGrab.grab(bbox=(x, y, x1, y1))
-        img = img.resize((1000, 1000), Image.LANCZOS)
-        img = np.array(img)
-        img = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
 
-        self.out.write(img)
+        self.out.write(self.render_frame(frame, is_show_born_joint))
 
         self.root.after(int(1000 / self.frame_rate), self.animate, frame + 1, is_show_born_joint)
 
-    def run(self, is_show_born_joint=False):
+    def _render_parallel(self, is_show_born_joint, workers, chunk_size):
+        """
+        Render frames in chunks across worker processes and write them to the video in order.
+
+        At most ``workers + 1`` chunks are in flight, so up to ``(workers + 1) * chunk_size`` rendered
+        frames (3 MB each at 1000x1000) may be held at once, independent of the video length. Each
+        worker also keeps its own copy of the renderer and the sprite atlases, and every frame is
+        pickled once on its way back to this process.
+
+        Args:
+            is_show_born_joint (bool): Whether to show joints and bones.
+            workers (int): Number of worker processes.
+            chunk_size (int): Number of frames rendered per task.
+        """
+        initargs = (self.renderer, self.atlases, self.center_arr, self.angle_arr, self.joint_pos_arr)
+        with ProcessPoolExecutor(workers, initializer=_init_render_worker, initargs=initargs) as executor:
+            pending = deque()
+            for start in range(0, self.total_frames, chunk_size):
+                stop = min(start + chunk_size, self.total_frames)
+                pending.append(executor.submit(_render_chunk, start, stop, is_show_born_joint))
+                if len(pending) > workers:
+                    for image in pending.popleft().result():
+                        self.out.write(image)
+            while pending:
+                for image in pending.popleft().result():
+                    self.out.write(image)
+
+    def run_headless(self, is_show_born_joint=False, workers=None, chunk_size=4):
+        """
+        Render every frame offscreen and write it to the video without opening a window.
+
+        Frames are produced as fast as they can be rendered and encoded, not at ``frame_rate``.
+        Frames are independent, so rendering is spread across worker processes, while encoding
+        stays in this process.
+
+        Args:
+            is_show_born_joint (bool): Whether to show joints and bones.
+            workers (int, optional): Number of worker processes. Defaults to the number of CPUs
+                this process may run on; 1 renders everything in this process.
+            chunk_size (int): Number of frames rendered per worker task. Together with ``workers``
+                it bounds the frames buffered in memory, see ``_render_parallel``.
+        """
+        if not workers:
+            if hasattr(os, 'process_cpu_count'):
+                workers = os.process_cpu_count() or 1
+            elif hasattr(os, 'sched_getaffinity'):
+                workers = len(os.sched_getaffinity(0))
+            else:
+                workers = os.cpu_count() or 1
+        try:
+            if workers > 1 and self.total_frames > chunk_size:
+                self._render_parallel(is_show_born_joint, workers, chunk_size)
+            else:
+                for frame in range(self.total_frames):
+                    self.out.write(self.render_frame(frame, is_show_born_joint))
+        except Exception as e:
+            print(f"An error occurred: {e}")
+        finally:
+            self.out.release()
+
+    def run(self, is_show_born_joint=False, preview=False):
         """
         Start the animation.
 
         Args:
             is_show_born_joint (bool): Whether to show joints and bones.
+            preview (bool): Whether to play the animation in a Tkinter window at ``frame_rate``
+                while recording. If False, the video is rendered headless with ``run_headless``.
         """
+        if not preview:
+            self.run_headless(is_show_born_joint)
+            return
+
         try:
+            self.root = tk.Tk()
+            self.canvas = AnimationCanvas(self.root, 1000, 1000, *self.canvas_options)
+            self.canvas.draw_grid(1000, 1000, 50)
             self.animate(0, is_show_born_joint)
             self.root.mainloop()
         except Exception as e:
             print(f"An error occurred: {e}")
             self.out.release()
-            self.root.destroy()
+            if self.root is not None:
+                self.root.destroy()
 
 if __name__ == "__main__":
     custom_angle_params = {